@@ -0,0 +1,125 @@
+const prefersReduced = window.matchMedia('(prefers-reduced-motion: reduce)').matches;
+
+function revealOnScroll() {
+  const revealItems = document.querySelectorAll('.reveal');
+  if (prefersReduced) {
+    revealItems.forEach((item) => item.classList.add('is-visible'));
+    return;
+  }
+  const observer = new IntersectionObserver((entries) => {
+    entries.forEach((entry) => {
+      if (entry.isIntersecting) {
+        entry.target.classList.add('is-visible');
+        observer.unobserve(entry.target);
+      }
+    });
+  }, { threshold: 0.2 });
+
+  revealItems.forEach((item) => observer.observe(item));
+}
+
+function smoothScroll() {
+  document.querySelectorAll('a[href^="#"]').forEach((link) => {
+    link.addEventListener('click', (event) => {
+      const targetId = link.getAttribute('href');
+      if (!targetId || targetId.length < 2) return;
+      const target = document.querySelector(targetId);
+      if (!target) return;
+      event.preventDefault();
+      target.scrollIntoView({ behavior: prefersReduced ? 'auto' : 'smooth' });
+    });
+  });
+}
+
+function setupNewsletter() {
+  const form = document.querySelector('[data-newsletter-form]');
+  if (!form) return;
+  const status = form.querySelector('.form-status');
+  const body = document.body;
+  const mode = body.dataset.newsletterMode || 'local';
+  const providerUrl = body.dataset.newsletterUrl || '';
+  form.addEventListener('submit', async (event) => {
+    if (mode !== 'local' && !providerUrl) return;
+    event.preventDefault();
+    const emailInput = form.querySelector('input[name="email"]');
+    const email = emailInput ? emailInput.value.trim() : '';
+    if (!email) {
+      status.textContent = 'Please enter a valid email.';
+      return;
+    }
+    const companyInput = form.querySelector('input[name="company"]');
+    const company = companyInput ? companyInput.value.trim() : '';
+    const endpoint = mode === 'local' || !providerUrl ? form.getAttribute('action') : providerUrl;
+    if (!endpoint) {
+      status.textContent = 'Newsletter endpoint is not configured.';
+      return;
+    }
+    status.textContent = 'Submitting...';
+    try {
+      const response = await fetch(endpoint, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+        body: new URLSearchParams({ email, company })
+      });
+      const payload = await response.json().catch(() => ({}));
+      if (response.ok && payload.ok) {
+        status.textContent = 'Thanks for subscribing.';
+        form.reset();
+      } else {
+        status.textContent = payload.error || 'Subscription failed. Please try again.';
+      }
+    } catch (error) {
+      status.textContent = 'Subscription failed. Please try again.';
+    }
+  });
+}
+
+function setupContactForm() {
+  const form = document.querySelector('[data-contact-form]');
+  if (!form) return;
+  const status = form.querySelector('.form-status');
+  form.addEventListener('submit', async (event) => {
+    event.preventDefault();
+    const nameInput = form.querySelector('input[name="name"]');
+    const emailInput = form.querySelector('input[name="email"]');
+    const messageInput = form.querySelector('textarea[name="message"]');
+    const companyInput = form.querySelector('input[name="company"]');
+    const name = nameInput ? nameInput.value.trim() : '';
+    const email = emailInput ? emailInput.value.trim() : '';
+    const message = messageInput ? messageInput.value.trim() : '';
+    const company = companyInput ? companyInput.value.trim() : '';
+    if (!name || !email || !message) {
+      status.textContent = 'Please complete all required fields.';
+      return;
+    }
+    const endpoint = form.getAttribute('action');
+    if (!endpoint) {
+      status.textContent = 'Contact endpoint is not configured.';
+      return;
+    }
+    status.textContent = 'Sending...';
+    try {
+      const response = await fetch(endpoint, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+        body: new URLSearchParams({ name, email, message, company })
+      });
+      const payload = await response.json().catch(() => ({}));
+      if (response.ok && payload.ok) {
+        status.textContent = 'Message sent. Thank you.';
+        form.reset();
+      } else {
+        status.textContent = payload.error || 'Message failed. Please try again.';
+      }
+    } catch (error) {
+      status.textContent = 'Message failed. Please try again.';
+    }
+  });
+}
+
+window.addEventListener('DOMContentLoaded', () => {
+  revealOnScroll();
+  smoothScroll();
+  setupNewsletter();
+  setupContactForm();
+});
@@ -0,0 +1,72 @@
+<?php
+header('Content-Type: application/json');
+
+function fail($code, $error) {
+  http_response_code($code);
+  echo json_encode(['ok' => false, 'error' => $error]);
+  exit;
+}
+
+if ($_SERVER['REQUEST_METHOD'] !== 'POST') {
+  fail(405, 'method_not_allowed');
+}
+
+$honeypot = trim($_POST['company'] ?? '');
+if ($honeypot !== '') {
+  fail(400, 'invalid_request');
+}
+
+$email = trim($_POST['email'] ?? '');
+if (!filter_var($email, FILTER_VALIDATE_EMAIL)) {
+  fail(400, 'invalid_email');
+}
+
+$dataDir = __DIR__ . '/data';
+if (!is_dir($dataDir)) {
+  mkdir($dataDir, 0750, true);
+}
+
+$rateFile = $dataDir . '/ratelimit.json';
+$ip = $_SERVER['REMOTE_ADDR'] ?? 'unknown';
+$now = time();
+$window = 3600;
+$limit = 8;
+
+$rateHandle = fopen($rateFile, 'c+');
+if (!$rateHandle) {
+  fail(500, 'storage_unavailable');
+}
+flock($rateHandle, LOCK_EX);
+$contents = stream_get_contents($rateHandle);
+$rateData = $contents ? json_decode($contents, true) : [];
+if (!is_array($rateData)) {
+  $rateData = [];
+}
+$entries = $rateData[$ip] ?? [];
+$entries = array_values(array_filter($entries, function($ts) use ($now, $window) {
+  return $ts >= ($now - $window);
+}));
+if (count($entries) >= $limit) {
+  flock($rateHandle, LOCK_UN);
+  fclose($rateHandle);
+  fail(429, 'rate_limited');
+}
+$entries[] = $now;
+$rateData[$ip] = $entries;
+rewind($rateHandle);
+ftruncate($rateHandle, 0);
+fwrite($rateHandle, json_encode($rateData, JSON_PRETTY_PRINT));
+flock($rateHandle, LOCK_UN);
+fclose($rateHandle);
+
+$file = $dataDir . '/newsletter_signups.csv';
+$handle = fopen($file, 'a');
+if (!$handle) {
+  fail(500, 'storage_unavailable');
+}
+flock($handle, LOCK_EX);
+fputcsv($handle, [gmdate('c'), $email, $ip]);
+flock($handle, LOCK_UN);
+fclose($handle);
+
+echo json_encode(['ok' => true]);
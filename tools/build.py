@@ -1,31 +1,60 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import csv
-import html
+import functools
+import gzip
+import hashlib
+import io
 import json
+import operator
 import os
 import re
 import shutil
-from datetime import datetime
+import string
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 CONTENT_DIR = BASE_DIR / "content"
 SITE_DIR = BASE_DIR / "site"
-ASSETS_DIR = SITE_DIR / "assets"
-CSS_DIR = ASSETS_DIR / "css"
-JS_DIR = ASSETS_DIR / "js"
-IMG_DIR = ASSETS_DIR / "img"
+IMG_DIR = SITE_DIR / "assets" / "img"
 BLOG_DIR = CONTENT_DIR / "blog"
 MEDIA_DIR = CONTENT_DIR / "media"
 BLOCKS_DIR = CONTENT_DIR / "blocks"
 DIGESTS_DIR = CONTENT_DIR / "digests"
+ASSET_SOURCES_DIR = BASE_DIR / "tools" / "assets"
 
 SITE_JSON = CONTENT_DIR / "site.json"
 CONTROL_CSV = CONTENT_DIR / "control.csv"
 LINKS_CSV = CONTENT_DIR / "links.csv"
+BUILD_CACHE = BASE_DIR / ".build_cache.json"
+WATCH_INTERVAL = 0.5
+
+STYLE_CSS = Path("assets/css/style.css")
+MAIN_JS = Path("assets/js/main.js")
+IMG_ROOT = Path("assets/img")
+SUBSCRIBE_PHP = Path("subscribe.php")
+CONTACT_PHP = Path("contact.php")
+DATA_HTACCESS = Path("data/.htaccess")
+SERVER_FILES = {
+    SUBSCRIBE_PHP: "subscribe.php",
+    CONTACT_PHP: "contact.php",
+    DATA_HTACCESS: "data.htaccess",
+}
 
 PLACEHOLDER_IMAGES = {
     "placeholder-hero.svg": "Warm abstract hero placeholder",
@@ -37,14 +66,44 @@ PLACEHOLDER_IMAGES = {
 
 NAV_SLUGS = ["", "about", "research", "projects", "digest", "blog", "contact"]
 
-
+_OUTPUTS: dict[Path, list] = {}
+_BUILD_CACHE: dict[str, list] = {}
+_HEADERS: dict[tuple[str, int, str], str] = {}
+_FOOTERS: dict[tuple[str, int], str] = {}
+_CREATED_DIRS: set[Path] = set()
+
+_PRECOMPRESS_SUFFIXES = {".html", ".css", ".js"}
+_COMPRESSORS = [(".gz", functools.partial(gzip.compress, compresslevel=9, mtime=0))]
+if brotli is not None:
+    _COMPRESSORS.append((".br", functools.partial(brotli.compress, quality=11)))
+
+_HIDDEN_STATUSES = {"draft", "hidden", "archived", "inactive"}
+_SECTION_DEFAULTS = {"title": "", "source_md": "", "cta_text": "", "cta_url": "", "hero_image": ""}
+_json_loads = orjson.loads if orjson is not None else json.loads
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_INTERTAG_WHITESPACE = re.compile(r">[ \t]*\n\s*<")
+_LIST_ITEM = re.compile(r"\s*[-*]\s*(.*)")
+_HEADING = re.compile(r"^(#{1,3})\s+(.*)$")
+_INLINE_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_SLUG_NONWORD = re.compile(r"[^a-zA-Z0-9\s-]")
+_SLUG_SPACES = re.compile(r"\s+")
+_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+@functools.lru_cache(maxsize=512)
 def _escape(text: str) -> str:
-    return html.escape(text or "", quote=True)
+    text = text or ""
+    if not _NEEDS_ESCAPE.search(text):
+        return text
+    return text.translate(_ESCAPE_TABLE)
 
 
 def _slugify(text: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9\s-]", "", text or "")
-    cleaned = re.sub(r"\s+", "-", cleaned.strip())
+    cleaned = _SLUG_NONWORD.sub("", text or "")
+    cleaned = _SLUG_SPACES.sub("-", cleaned.strip())
     return cleaned.lower() or "post"
 
 
@@ -52,19 +111,20 @@ def _split_paragraphs(text: str) -> list[str]:
     normalized = (text or "").replace("\\n", "\n").strip()
     if not normalized:
         return []
-    chunks = re.split(r"\n\s*\n", normalized)
-    return [chunk.strip() for chunk in chunks if chunk.strip()]
+    return [chunk for chunk in map(str.strip, _PARAGRAPH_BREAK.split(normalized)) if chunk]
 
 
 def _render_paragraphs(text: str) -> str:
-    return "\n".join(f"<p>{_escape(p)}</p>" for p in _split_paragraphs(text))
+    parts: list[str] = []
+    for paragraph in _split_paragraphs(text):
+        parts.extend(("<p>", _escape(paragraph), "</p>", "\n"))
+    return "".join(parts[:-1])
 
 
 def _render_inline_markdown(text: str) -> str:
-    pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
     parts: list[str] = []
     last = 0
-    for match in pattern.finditer(text or ""):
+    for match in _INLINE_LINK.finditer(text or ""):
         parts.append(_escape((text or "")[last:match.start()]))
         label = _escape(match.group(1))
         href = _escape(match.group(2))
@@ -78,20 +138,21 @@ def _render_markdown(text: str) -> str:
     cleaned = (text or "").replace("\\r\\n", "\n").strip()
     if not cleaned:
         return ""
-    blocks = re.split(r"\n\s*\n", cleaned)
+    blocks = _PARAGRAPH_BREAK.split(cleaned)
     rendered: list[str] = []
     for block in blocks:
-        lines = [line.rstrip() for line in block.splitlines() if line.strip()]
+        lines = [line for line in map(str.rstrip, block.splitlines()) if line]
         if not lines:
             continue
-        if all(line.lstrip().startswith(("-", "*")) for line in lines):
+        list_items = [_LIST_ITEM.match(line) for line in lines]
+        if all(list_items):
             items = [
-                f"<li>{_render_inline_markdown(line.lstrip()[1:].strip())}</li>"
-                for line in lines
+                f"<li>{_render_inline_markdown(item.group(1))}</li>"
+                for item in list_items
             ]
             rendered.append("<ul>" + "".join(items) + "</ul>")
             continue
-        heading_match = re.match(r"^(#{1,3})\s+(.*)$", lines[0])
+        heading_match = _HEADING.match(lines[0])
         if heading_match:
             level = len(heading_match.group(1))
             heading = _render_inline_markdown(heading_match.group(2))
@@ -130,22 +191,40 @@ def _read_block(source_md: str) -> str:
     return path.read_text(encoding="utf-8")
 
 
+@functools.lru_cache(maxsize=None)
+def _render_block(source_md: str) -> str:
+    return _render_markdown(_read_block(source_md))
+
+
+@functools.lru_cache(maxsize=1)
 def _read_site_config() -> dict[str, str]:
     if SITE_JSON.exists():
-        return json.loads(SITE_JSON.read_text(encoding="utf-8"))
-    return {
-        "site_name": "Artificial Life Institute",
-        "site_tagline": "",
-        "meta_description": "Artificial Life Institute at the University of Vienna",
-        "contact_blurb": "",
-        "domain": "",
-        "newsletter_mode": "local",
-        "newsletter_provider_url": "",
-        "layout_variant": "standard",
-        "footer_note": "",
-        "address": "",
-        "show_digest_home": "false",
-    }
+        site = _json_loads(SITE_JSON.read_bytes())
+    else:
+        site = {
+            "site_name": "Artificial Life Institute",
+            "site_tagline": "",
+            "meta_description": "Artificial Life Institute at the University of Vienna",
+            "contact_blurb": "",
+            "domain": "",
+            "newsletter_mode": "local",
+            "newsletter_provider_url": "",
+            "layout_variant": "standard",
+            "footer_note": "",
+            "address": "",
+            "show_digest_home": "false",
+        }
+    site["site_name_html"] = _escape(site.get("site_name", "Artificial Life Institute"))
+    site["site_tagline_html"] = _escape(site.get("site_tagline", ""))
+    site["meta_description_html"] = _escape(site.get("meta_description", ""))
+    site["contact_blurb_html"] = _escape(site.get("contact_blurb", ""))
+    site["contact_blurb_paragraphs_html"] = _render_paragraphs(site.get("contact_blurb", ""))
+    site["newsletter_mode_html"] = _escape(site.get("newsletter_mode", "local"))
+    site["newsletter_url_html"] = _escape(site.get("newsletter_provider_url", ""))
+    site["address_html"] = _escape(site.get("address", ""))
+    site["footer_note_html"] = _escape(site.get("footer_note", ""))
+    site["domain_html"] = _escape(site.get("domain", ""))
+    return site
 
 
 def _normalize_slug(raw_slug: str) -> str:
@@ -167,24 +246,43 @@ def _page_link_path(slug: str) -> Path:
     return Path(slug)
 
 
+_LEGAL_SLUGS = ("privacy", "imprint")
+_PAGE_LINK_TARGETS = {slug: _page_link_path(slug).as_posix() for slug in (*NAV_SLUGS, *_LEGAL_SLUGS)}
+
+
+_IMG_ROOT_PREFIX = IMG_ROOT.as_posix() + "/"
+
+
+def _root_prefix(current_path: Path) -> str:
+    return "../" * (len(current_path.parts) - 1)
+
+
 def _rel_link(current_path: Path, target_path: Path) -> str:
-    current_dir = current_path.parent.as_posix()
-    target = target_path.as_posix()
-    rel = os.path.relpath(target, start=current_dir)
-    return rel
+    return _root_prefix(current_path) + target_path.as_posix()
 
 
-def _rel_dir_link(current_path: Path, target_dir: Path) -> str:
-    current_dir = current_path.parent.as_posix() or "."
-    target_dir_str = target_dir.as_posix() or "."
-    rel = os.path.relpath(target_dir_str, start=current_dir)
+@functools.lru_cache(maxsize=None)
+def _rel_dir(target_dir: str, current_dir: str) -> str:
+    rel = os.path.relpath(target_dir, start=current_dir)
     if rel == ".":
         return "./"
     return rel.rstrip("/") + "/"
 
 
+def _rel_dir_link(current_path: Path, target_dir: Path) -> str:
+    return _rel_dir(target_dir.as_posix() or ".", current_path.parent.as_posix() or ".")
+
+
 def _rel_page_link(current_path: Path, slug: str) -> str:
-    return _rel_dir_link(current_path, _page_link_path(slug))
+    target = _PAGE_LINK_TARGETS.get(slug)
+    if target is None:
+        target = _page_link_path(slug).as_posix()
+    return _rel_dir(target, current_path.parent.as_posix())
+
+
+def _link_scope(current_path: Path) -> tuple[str, int]:
+    parts = current_path.parent.parts
+    return (parts[0] if parts else "", len(parts))
 
 
 def _resolve_image_src(raw_image: str, current_path: Path) -> str:
@@ -192,65 +290,100 @@ def _resolve_image_src(raw_image: str, current_path: Path) -> str:
     if not image:
         image = "placeholder-hero.svg"
     if image.startswith("assets/"):
-        return _rel_link(current_path, Path(image))
-    return _rel_link(current_path, Path("assets/img") / image)
+        return _root_prefix(current_path) + image
+    return _root_prefix(current_path) + _IMG_ROOT_PREFIX + image
+
+
+def _read_csv(path: Path) -> tuple[list[str], list[list[str]]]:
+    reader = csv.reader(io.StringIO(path.read_bytes().decode("utf-8"), newline=""))
+    header = next(reader, [])
+    rows: list[list[str]] = []
+    for row in reader:
+        if not row:
+            continue
+        values = [value.strip() for value in row]
+        values.extend([""] * (len(header) - len(values)))
+        rows.append(values)
+    return header, rows
 
 
 def _read_control() -> dict[str, dict[str, object]]:
     if not CONTROL_CSV.exists():
         raise SystemExit(f"Missing control file: {CONTROL_CSV}")
     pages: dict[str, dict[str, object]] = {}
-    with CONTROL_CSV.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            data = {key: (value or "").strip() for key, value in row.items()}
-            status = (data.get("status") or "").lower()
-            if status in {"draft", "hidden", "archived", "inactive"}:
-                continue
-            slug = _normalize_slug(data.get("page_slug", ""))
-            order = int(data.get("order") or 0)
-            entry = pages.setdefault(
-                slug,
-                {
-                    "title": slug.title() or "Home",
-                    "sections": [],
-                    "order": 0,
-                },
-            )
-            kind = (data.get("kind") or "section").lower()
-            if kind in {"page", "meta"}:
-                if data.get("title"):
-                    entry["title"] = data["title"]
-                entry["order"] = order
-                continue
-            section_id = data.get("section") or data.get("id") or ""
-            entry["sections"].append(
-                {
-                    **data,
-                    "order": order,
-                    "page_slug": slug,
-                    "section_id": section_id,
-                    "kind": kind,
-                }
-            )
+    header, rows = _read_csv(CONTROL_CSV)
+    status_col = header.index("status") if "status" in header else None
+    for row in rows:
+        if status_col is not None and row[status_col].lower() in _HIDDEN_STATUSES:
+            continue
+        data = dict(zip(header, row))
+        slug = _normalize_slug(data.get("page_slug", ""))
+        order = int(data.get("order") or 0)
+        entry = pages.get(slug)
+        if entry is None:
+            entry = pages[slug] = {
+                "title": slug.title() or "Home",
+                "sections": [],
+                "order": 0,
+            }
+        kind = (data.get("kind") or "section").lower()
+        if kind in {"page", "meta"}:
+            if data.get("title"):
+                entry["title"] = data["title"]
+            entry["order"] = order
+            continue
+        section_id = data.get("section") or data.get("id") or ""
+        entry["sections"].append(
+            {
+                **_SECTION_DEFAULTS,
+                **data,
+                "order": order,
+                "page_slug": slug,
+                "section_id": section_id,
+                "kind": kind,
+            }
+        )
+    by_order = operator.itemgetter("order")
     for page in pages.values():
-        page["sections"] = sorted(page["sections"], key=lambda item: item["order"])
+        page["sections"].sort(key=by_order)
+        page["title_html"] = _escape(page["title"])
     return pages
 
 
+@functools.lru_cache(maxsize=1)
 def _read_links() -> list[dict[str, str]]:
     if not LINKS_CSV.exists():
         return []
-    items: list[dict[str, str]] = []
-    with LINKS_CSV.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            data = {key: (value or "").strip() for key, value in row.items()}
-            if not data.get("label"):
-                continue
-            items.append(data)
-    items.sort(key=lambda item: int(item.get("order") or 0))
-    return items
+    items: list[tuple[int, dict[str, str]]] = []
+    header, rows = _read_csv(LINKS_CSV)
+    columns = {name: index for index, name in enumerate(header)}
+    if "label" not in columns:
+        return []
+    label_col = columns["label"]
+    url_col = columns.get("url")
+    kind_col = columns.get("kind")
+    order_col = columns.get("order")
+    for row in rows:
+        label = row[label_col]
+        if not label:
+            continue
+        url = row[url_col] if url_col is not None else ""
+        order = row[order_col] if order_col is not None else ""
+        items.append(
+            (
+                int(order or 0),
+                {
+                    "label": label,
+                    "url": url,
+                    "kind": row[kind_col] if kind_col is not None else "",
+                    "order": order,
+                    "label_html": _escape(label),
+                    "url_html": _escape(url),
+                },
+            )
+        )
+    items.sort(key=operator.itemgetter(0))
+    return [item for _order, item in items]
 
 
 def _read_digests() -> list[dict[str, str]]:
@@ -259,7 +392,7 @@ def _read_digests() -> list[dict[str, str]]:
     index_path = DIGESTS_DIR / "index.json"
     if not index_path.exists():
         return []
-    raw = json.loads(index_path.read_text(encoding="utf-8"))
+    raw = _json_loads(index_path.read_bytes())
     items = []
     for entry in raw.get("digests", []):
         if not isinstance(entry, dict):
@@ -270,57 +403,69 @@ def _read_digests() -> list[dict[str, str]]:
         source_md = str(entry.get("source_md", "")).strip()
         if not (date and slug and source_md):
             continue
+        title = title or f"Digest {date}"
         items.append(
             {
                 "date": date,
-                "title": title or f"Digest {date}",
+                "title": title,
                 "slug": slug,
                 "source_md": source_md,
+                "date_html": _escape(date),
+                "title_html": _escape(title),
             }
         )
     return items
 
 
-def _parse_blog_post(path: Path) -> dict[str, str]:
-    raw = path.read_text(encoding="utf-8")
+def _parse_blog_post(entry: os.DirEntry[str]) -> dict[str, str]:
+    path = Path(entry.path)
     title = ""
     date = ""
-    body_lines: list[str] = []
-    in_body = False
-    for line in raw.splitlines():
-        if not in_body and line.strip() == "":
-            in_body = True
-            continue
-        if not in_body:
+    body = ""
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip() == "" or line.startswith("Body:"):
+                body = handle.read().strip()
+                break
             if line.startswith("Title:"):
                 title = line.split(":", 1)[1].strip()
             elif line.startswith("Date:"):
                 date = line.split(":", 1)[1].strip()
-            elif line.startswith("Body:"):
-                in_body = True
-        else:
-            body_lines.append(line)
     if not title:
         title = path.stem
     if not date:
-        date = datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y-%m-%d")
-    body = "\n".join(body_lines).strip()
+        date = time.strftime("%Y-%m-%d", time.localtime(entry.stat().st_mtime))
     slug = _slugify(path.stem)
-    return {"title": title, "date": date, "body": body, "slug": slug}
+    excerpt = _split_paragraphs(body)
+    return {
+        "title": title,
+        "date": date,
+        "body": body,
+        "slug": slug,
+        "title_html": _escape(title),
+        "date_html": _escape(date),
+        "teaser_html": _escape(excerpt[0]) if excerpt else "",
+        "body_html": _render_paragraphs(body),
+    }
 
 
 def _read_blog_posts() -> list[dict[str, str]]:
     if not BLOG_DIR.exists():
         return []
-    posts = [_parse_blog_post(path) for path in sorted(BLOG_DIR.glob("*.txt"))]
-    posts.sort(key=lambda item: item.get("date", ""), reverse=True)
+    with os.scandir(BLOG_DIR) as entries:
+        sources = sorted(
+            (entry for entry in entries if entry.name.endswith(".txt") and entry.is_file()),
+            key=lambda entry: entry.name,
+        )
+    posts = [_parse_blog_post(entry) for entry in sources]
+    posts.sort(key=operator.itemgetter("date"), reverse=True)
     return posts
 
 
 def _resolve_cta_url(raw_url: str, pages: dict[str, dict[str, object]], current_path: Path) -> str:
     if not raw_url:
         return ""
-    if raw_url.startswith("http") or raw_url.startswith("mailto:") or raw_url.startswith("#"):
+    if raw_url.startswith(("http", "mailto:", "#")):
         return raw_url
     slug = _normalize_slug(raw_url)
     if slug in pages:
@@ -332,85 +477,77 @@ def _render_newsletter_form(site: dict[str, str], current_path: Path) -> str:
     mode = (site.get("newsletter_mode") or "local").strip()
     provider_url = (site.get("newsletter_provider_url") or "").strip()
     if mode == "local" or not provider_url:
-        endpoint = _rel_link(current_path, Path("subscribe.php"))
+        endpoint = _rel_link(current_path, SUBSCRIBE_PHP)
     else:
         endpoint = provider_url
-    return f"""
-<div class=\"newsletter\" id=\"newsletter\">
-  <div>
-    <h3>Newsletter</h3>
-    <p>Subscribe for institute updates, events, and research highlights.</p>
-  </div>
-  <form class=\"newsletter-form\" data-newsletter-form action=\"{_escape(endpoint)}\" method=\"post\">
-    <label class=\"sr-only\" for=\"newsletter-email\">Email</label>
-    <input id=\"newsletter-email\" name=\"email\" type=\"email\" placeholder=\"you@example.org\" required />
-    <div class=\"sr-only\" aria-hidden=\"true\">
-      <label for=\"newsletter-company\">Company</label>
-      <input id=\"newsletter-company\" name=\"company\" type=\"text\" tabindex=\"-1\" autocomplete=\"off\" />
-    </div>
-    <button class=\"button\" type=\"submit\">Subscribe</button>
-    <p class=\"form-status\" aria-live=\"polite\"></p>
-  </form>
-</div>
-"""
+    return _fill_template(_NEWSLETTER_TEMPLATE, {"endpoint": _escape(endpoint)})
 
 
 def _render_links(links: list[dict[str, str]]) -> str:
     if not links:
         return ""
-    items = []
-    for link in links:
-        label = _escape(link.get("label", ""))
-        url = _escape(link.get("url", ""))
-        kind = (link.get("kind") or "").strip()
-        class_name = "tag" if kind == "placeholder" else "tag primary"
-        items.append(f"<a class=\"{class_name}\" href=\"{url}\" rel=\"noopener\">{label}</a>")
-    return "<div class=\"tag-list\">" + "".join(items) + "</div>"
+    items = "".join(
+        f"<a class=\"{'tag' if link.get('kind') == 'placeholder' else 'tag primary'}\" href=\"{link['url_html']}\" rel=\"noopener\">{link['label_html']}</a>"
+        for link in links
+    )
+    return "<div class=\"tag-list\">" + items + "</div>"
 
 
-def _render_head(title: str, css_href: str, description: str) -> str:
+@functools.lru_cache(maxsize=None)
+def _render_head(title: str, css_href: str, description_html: str) -> str:
     return f"""
 <head>
   <meta charset=\"utf-8\" />
   <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
   <title>{_escape(title)}</title>
-  <meta name=\"description\" content=\"{_escape(description)}\" />
+  <meta name=\"description\" content=\"{description_html}\" />
   <link rel=\"stylesheet\" href=\"{_escape(css_href)}\" />
 </head>
 """
 
 
-def _render_header(current_slug: str, pages: dict[str, dict[str, object]], current_path: Path) -> str:
-    nav_links = []
-    for slug in NAV_SLUGS:
-        if slug not in pages:
-            continue
-        title = pages[slug]["title"]
-        href = _rel_page_link(current_path, slug)
-        active = "active" if slug == current_slug else ""
-        nav_links.append(f"<a class=\"{active}\" href=\"{_escape(href)}\">{_escape(title)}</a>")
-    cta_href = _rel_page_link(current_path, "contact") if "contact" in pages else "#"
-    return f"""
+def _nav_titles(pages: dict[str, dict[str, object]]) -> dict[str, str]:
+    return {slug: pages[slug]["title_html"] for slug in NAV_SLUGS if slug in pages}
+
+
+def _render_header(current_slug: str, nav: dict[str, str], current_path: Path) -> str:
+    top, depth = _link_scope(current_path)
+    key = (top if top in nav else "", depth, current_slug)
+    cached = _HEADERS.get(key)
+    if cached is not None:
+        return cached
+    nav_links = "".join(
+        f"<a class=\"{'active' if slug == current_slug else ''}\" href=\"{_escape(_rel_page_link(current_path, slug))}\">{title}</a>"
+        for slug, title in nav.items()
+    )
+    cta_href = _rel_page_link(current_path, "contact") if "contact" in nav else "#"
+    header = f"""
 <header class=\"site-header\">
   <a class=\"logo\" href=\"{_escape(_rel_page_link(current_path, ""))}\">ALI</a>
-  <nav class=\"nav\">{''.join(nav_links)}</nav>
+  <nav class=\"nav\">{nav_links}</nav>
   <a class=\"cta\" href=\"{_escape(cta_href)}\">Get in touch</a>
 </header>
 """
+    _HEADERS[key] = header
+    return header
 
 
 def _render_footer(site: dict[str, str], pages: dict[str, dict[str, object]], current_path: Path, links: list[dict[str, str]]) -> str:
-    footer_links = []
-    for slug in ("privacy", "imprint"):
-        if slug in pages:
-            href = _rel_page_link(current_path, slug)
-            footer_links.append(f"<a href=\"{_escape(href)}\">{_escape(pages[slug]['title'])}</a>")
-    links_html = "".join(footer_links)
+    top, depth = _link_scope(current_path)
+    key = (top if top in _LEGAL_SLUGS else "", depth)
+    cached = _FOOTERS.get(key)
+    if cached is not None:
+        return cached
+    links_html = "".join(
+        f"<a href=\"{_escape(_rel_page_link(current_path, slug))}\">{pages[slug]['title_html']}</a>"
+        for slug in _LEGAL_SLUGS
+        if slug in pages
+    )
     digital_html = _render_links(links)
-    address = _escape(site.get("address", ""))
-    note = _escape(site.get("footer_note", ""))
-    domain = _escape(site.get("domain", ""))
-    return f"""
+    address = site["address_html"]
+    note = site["footer_note_html"]
+    domain = site["domain_html"]
+    footer = f"""
 <footer class=\"site-footer\">
   <div class=\"footer-grid\">
     <div>
@@ -430,114 +567,91 @@ def _render_footer(site: dict[str, str], pages: dict[str, dict[str, object]], cu
   </div>
 </footer>
 """
+    _FOOTERS[key] = footer
+    return footer
 
 
-def _render_section(
+def _render_content_section(
     section: dict[str, str],
     current_path: Path,
     pages: dict[str, dict[str, object]],
     digests: list[dict[str, str]],
 ) -> str:
-    kind = (section.get("kind") or "section").lower()
-    if kind == "contact_form":
-        return _render_contact_form(section, current_path)
-    if kind == "digest_list":
-        return _render_digest_list(section, current_path, digests)
     heading = _escape(section.get("title", ""))
-    body = _render_markdown(_read_block(section.get("source_md", "")))
+    body = _render_block(section.get("source_md", ""))
     cta_text = _escape(section.get("cta_text", ""))
-    raw_cta_url = section.get("cta_url", "")
-    cta_url = _resolve_cta_url(raw_cta_url, pages, current_path)
-    cta = ""
-    if cta_text and cta_url:
-        cta = f"<a class=\"button ghost\" href=\"{_escape(cta_url)}\">{cta_text}</a>"
+    cta_url = _resolve_cta_url(section.get("cta_url", ""), pages, current_path) if cta_text else ""
     image_src = _resolve_image_src(section.get("hero_image", ""), current_path)
-    image = f"<figure class=\"image-frame\"><img src=\"{_escape(image_src)}\" alt=\"{heading} image\" /></figure>"
     section_id = _escape(section.get("section_id", ""))
-    return f"""
-<section class=\"content-section\" id=\"{section_id}\">
-  <div class=\"content-grid\">
-    <div>
-      <h2>{heading}</h2>
-      {body}
-      {cta}
-    </div>
-    {image}
-  </div>
-</section>
-"""
+    parts = [
+        "\n<section class=\"content-section\" id=\"", section_id, "\">\n",
+        "  <div class=\"content-grid\">\n",
+        "    <div>\n",
+        "      <h2>", heading, "</h2>\n",
+        "      ", body, "\n",
+        "      ",
+    ]
+    if cta_text and cta_url:
+        parts.extend(("<a class=\"button ghost\" href=\"", _escape(cta_url), "\">", cta_text, "</a>"))
+    parts.extend((
+        "\n",
+        "    </div>\n",
+        "    <figure class=\"image-frame\"><img src=\"", _escape(image_src), "\" alt=\"", heading, " image\" /></figure>\n",
+        "  </div>\n",
+        "</section>\n",
+    ))
+    return "".join(parts)
 
 
 def _render_linkhub_links(links: list[dict[str, str]]) -> str:
     if not links:
         return ""
-    items = []
-    for link in links:
-        label = _escape(link.get("label", ""))
-        url = _escape(link.get("url", ""))
-        kind = (link.get("kind") or "").strip()
-        class_name = "linkhub-link placeholder" if kind == "placeholder" else "linkhub-link"
-        items.append(f"<a class=\"{class_name}\" href=\"{url}\" rel=\"noopener\">{label}</a>")
-    return "<div class=\"linkhub-links\">" + "".join(items) + "</div>"
+    items = "".join(
+        f"<a class=\"{'linkhub-link placeholder' if link.get('kind') == 'placeholder' else 'linkhub-link'}\" href=\"{link['url_html']}\" rel=\"noopener\">{link['label_html']}</a>"
+        for link in links
+    )
+    return "<div class=\"linkhub-links\">" + items + "</div>"
 
 
-def _render_contact_form(section: dict[str, str], current_path: Path) -> str:
+def _render_contact_form(
+    section: dict[str, str],
+    current_path: Path,
+    pages: dict[str, dict[str, object]],
+    digests: list[dict[str, str]],
+) -> str:
     section_id = _escape(section.get("section_id", "contact-form"))
     heading = _escape(section.get("title", "Contact"))
-    body = _render_markdown(_read_block(section.get("source_md", "")))
-    endpoint = _rel_link(current_path, Path("contact.php"))
-    return f"""
-<section class=\"content-section contact-section\" id=\"{section_id}\">
-  <div class=\"content-grid\">
-    <div>
-      <h2>{heading}</h2>
-      {body}
-    </div>
-    <div class=\"contact-card\">
-      <form class=\"contact-form\" data-contact-form action=\"{_escape(endpoint)}\" method=\"post\">
-        <div class=\"contact-field\">
-          <label for=\"contact-name\">Name</label>
-          <input id=\"contact-name\" name=\"name\" type=\"text\" required />
-        </div>
-        <div class=\"contact-field\">
-          <label for=\"contact-email\">Email</label>
-          <input id=\"contact-email\" name=\"email\" type=\"email\" required />
-        </div>
-        <div class=\"contact-field\">
-          <label for=\"contact-message\">Message</label>
-          <textarea id=\"contact-message\" name=\"message\" rows=\"5\" required></textarea>
-        </div>
-        <div class=\"contact-field sr-only\" aria-hidden=\"true\">
-          <label for=\"contact-company\">Company</label>
-          <input id=\"contact-company\" name=\"company\" type=\"text\" tabindex=\"-1\" autocomplete=\"off\" />
-        </div>
-        <button class=\"button\" type=\"submit\">Send message</button>
-        <p class=\"form-status\" aria-live=\"polite\"></p>
-      </form>
-    </div>
-  </div>
-</section>
-"""
+    body = _render_block(section.get("source_md", ""))
+    endpoint = _rel_link(current_path, CONTACT_PHP)
+    return _fill_template(
+        _CONTACT_FORM_TEMPLATE,
+        {"section_id": section_id, "heading": heading, "body": body, "endpoint": _escape(endpoint)},
+    )
 
 
-def _render_digest_list(section: dict[str, str], current_path: Path, digests: list[dict[str, str]]) -> str:
+def _render_digest_list(
+    section: dict[str, str],
+    current_path: Path,
+    pages: dict[str, dict[str, object]],
+    digests: list[dict[str, str]],
+) -> str:
     section_id = _escape(section.get("section_id", "digest"))
     heading = _escape(section.get("title", "Digest"))
-    intro = _render_markdown(_read_block(section.get("source_md", "")))
+    intro = _render_block(section.get("source_md", ""))
     items = digests[:5]
     if not items:
         listing = "<p>No digests yet. Run tools/fetch_digest.py to create the first issue.</p>"
     else:
-        cards = []
+        parts = ["<div class=\"digest-grid\">"]
         for digest in items:
             target = _rel_dir_link(current_path, Path("digest") / digest["slug"])
-            cards.append(
-                f"""<article class=\"digest-card\">
-  <p class=\"post-date\">{_escape(digest['date'])}</p>
-  <h3><a href=\"{_escape(target)}\">{_escape(digest['title'])}</a></h3>
-</article>"""
-            )
-        listing = "<div class=\"digest-grid\">" + "".join(cards) + "</div>"
+            parts.extend((
+                "<article class=\"digest-card\">\n  <p class=\"post-date\">", digest["date_html"],
+                "</p>\n  <h3><a href=\"", _escape(target), "\">", digest["title_html"],
+                "</a></h3>\n</article>",
+            ))
+        parts.append("</div>")
+        listing = "".join(parts)
     return f"""
 <section class=\"content-section digest-section\" id=\"{section_id}\">
   <div class=\"content-grid\">
@@ -553,1179 +667,308 @@ def _render_digest_list(section: dict[str, str], current_path: Path, digests: li
 """
 
 
-def _render_home_overview(pages: dict[str, dict[str, object]], current_path: Path) -> str:
-    cards = []
-    for slug in NAV_SLUGS:
-        if slug in ("", "blog", "contact"):
-            continue
-        if slug not in pages:
-            continue
-        title = pages[slug]["title"]
-        target = _rel_page_link(current_path, slug)
-        extra_class = " wide" if slug == "projects" else ""
-        cards.append(
-            f"<a class=\"card{extra_class}\" href=\"{_escape(target)}\"><h3>{_escape(title)}</h3><p>Placeholder summary for { _escape(title) }.</p></a>"
-        )
-    return "<div class=\"card-grid\">" + "".join(cards) + "</div>"
+_SECTION_RENDERERS = {
+    "contact_form": _render_contact_form,
+    "digest_list": _render_digest_list,
+}
+
+
+def _render_section(
+    section: dict[str, str],
+    current_path: Path,
+    pages: dict[str, dict[str, object]],
+    digests: list[dict[str, str]],
+) -> str:
+    renderer = _SECTION_RENDERERS.get(section.get("kind", ""), _render_content_section)
+    return renderer(section, current_path, pages, digests)
+
+
+def _render_home_overview(nav: dict[str, str], current_path: Path) -> str:
+    cards = "".join(
+        f"<a class=\"card{' wide' if slug == 'projects' else ''}\" href=\"{_escape(_rel_page_link(current_path, slug))}\"><h3>{title}</h3><p>Placeholder summary for {title}.</p></a>"
+        for slug, title in nav.items()
+        if slug not in ("", "blog", "contact")
+    )
+    return "<div class=\"card-grid\">" + cards + "</div>"
 
 
 def _render_blog_index(posts: list[dict[str, str]], current_path: Path) -> str:
     if not posts:
         return "<p>No posts yet. Add a file to content/blog/ to publish the first update.</p>"
-    cards = []
+    parts = ["<div class=\"post-grid\">"]
     for post in posts:
         target = _rel_dir_link(current_path, Path("blog") / post["slug"])
-        excerpt = _split_paragraphs(post.get("body", ""))
-        teaser = excerpt[0] if excerpt else ""
-        cards.append(
-            """
-<article class=\"post-card\">
-  <p class=\"post-date\">{date}</p>
-  <h3><a href=\"{href}\">{title}</a></h3>
-  <p>{teaser}</p>
-</article>
-""".format(
-                date=_escape(post.get("date", "")),
-                href=_escape(target),
-                title=_escape(post.get("title", "")),
-                teaser=_escape(teaser),
-            )
-        )
-    return "<div class=\"post-grid\">" + "".join(cards) + "</div>"
+        parts.extend((
+            "\n<article class=\"post-card\">\n  <p class=\"post-date\">", post["date_html"],
+            "</p>\n  <h3><a href=\"", _escape(target), "\">", post["title_html"],
+            "</a></h3>\n  <p>", post["teaser_html"], "</p>\n</article>\n",
+        ))
+    parts.append("</div>")
+    return "".join(parts)
 
 
 def _render_digest_index(digests: list[dict[str, str]], current_path: Path) -> str:
     if not digests:
         return "<p>No digests yet. Add feeds and run tools/fetch_digest.py to publish the first issue.</p>"
-    cards = []
+    parts = ["<div class=\"digest-grid\">"]
     for digest in digests:
         target = _rel_dir_link(current_path, Path("digest") / digest["slug"])
-        cards.append(
-            """
-<article class=\"digest-card\">
-  <p class=\"post-date\">{date}</p>
-  <h3><a href=\"{href}\">{title}</a></h3>
-</article>
-""".format(
-                date=_escape(digest.get("date", "")),
-                href=_escape(target),
-                title=_escape(digest.get("title", "")),
-            )
-        )
-    return "<div class=\"digest-grid\">" + "".join(cards) + "</div>"
+        parts.extend((
+            "\n<article class=\"digest-card\">\n  <p class=\"post-date\">", digest["date_html"],
+            "</p>\n  <h3><a href=\"", _escape(target), "\">", digest["title_html"],
+            "</a></h3>\n</article>\n",
+        ))
+    parts.append("</div>")
+    return "".join(parts)
 
 
-def _render_digest_page(digest: dict[str, str], pages: dict[str, dict[str, object]], site: dict[str, str], links: list[dict[str, str]]) -> None:
-    slug = digest["slug"]
-    current_path = Path("digest") / slug / "index.html"
-    css_href = _rel_link(current_path, Path("assets/css/style.css"))
-    header = _render_header("digest", pages, current_path)
-    footer = _render_footer(site, pages, current_path, links)
-    back_link = _rel_page_link(current_path, "digest")
-    body_html = _render_markdown(_read_block(digest.get("source_md", "")))
-    doc = f"""<!doctype html>
+def _input_snapshot() -> dict[str, tuple[int, int]]:
+    snapshot: dict[str, tuple[int, int]] = {}
+    for watched in (CONTENT_DIR, ASSET_SOURCES_DIR):
+        for root, _dirs, files in os.walk(watched):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def _input_fingerprint() -> str:
+    script = os.stat(__file__)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{script.st_size}\0{script.st_mtime_ns}\0{','.join(suffix for suffix, _ in _COMPRESSORS)}\n".encode("utf-8"))
+    for path, (size, mtime_ns) in sorted(_input_snapshot().items()):
+        digest.update(f"{path}\0{size}\0{mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_build_cache() -> dict[str, object]:
+    try:
+        cache = _json_loads(BUILD_CACHE.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_build_cache(inputs: str) -> None:
+    cache = {
+        "inputs": inputs,
+        "outputs": {path.relative_to(SITE_DIR).as_posix(): record for path, record in _OUTPUTS.items()},
+    }
+    _atomic_write_bytes(BUILD_CACHE, (json.dumps(cache, indent=2, sort_keys=True) + "\n").encode("utf-8"))
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _stat_record(path: Path) -> list | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _recorded_output(path: Path, stat: list | None) -> list | None:
+    recorded = _BUILD_CACHE.get(path.relative_to(SITE_DIR).as_posix())
+    if stat is None or not isinstance(recorded, list) or recorded[1:] != stat:
+        return None
+    return recorded
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    stat = _stat_record(path)
+    if stat is None:
+        unchanged = False
+        if path.parent not in _CREATED_DIRS:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _CREATED_DIRS.add(path.parent)
+    else:
+        recorded = _recorded_output(path, stat)
+        if recorded is None:
+            unchanged = stat[0] == len(data) and path.read_bytes() == data
+        else:
+            unchanged = recorded[0] == digest
+    if not unchanged:
+        _atomic_write_bytes(path, data)
+        stat = _stat_record(path)
+    _OUTPUTS[path] = [digest, *stat]
+    if path.suffix in _PRECOMPRESS_SUFFIXES:
+        _write_precompressed(path, data, unchanged)
+
+
+def _write_precompressed(path: Path, data: bytes, unchanged: bool) -> None:
+    for suffix, compress in _COMPRESSORS:
+        sibling = path.with_name(path.name + suffix)
+        if unchanged:
+            recorded = _recorded_output(sibling, _stat_record(sibling))
+            if recorded is not None:
+                _OUTPUTS[sibling] = recorded
+                continue
+        _write_if_changed(sibling, compress(data))
+
+
+def _prune_stale_outputs() -> None:
+    for root, _dirs, files in os.walk(SITE_DIR, topdown=False):
+        root_path = Path(root)
+        for name in files:
+            path = root_path / name
+            if path not in _OUTPUTS:
+                path.unlink()
+        if root_path != SITE_DIR and not any(root_path.iterdir()):
+            root_path.rmdir()
+
+
+def _write_page(current_path: Path, doc: str) -> None:
+    doc = _INTERTAG_WHITESPACE.sub(">\n<", doc)
+    _write_if_changed(SITE_DIR / current_path, doc.encode("utf-8"))
+
+
+def _compile_template(source: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    literals: list[str] = []
+    fields: list[str] = []
+    for literal, field, _spec, _conversion in string.Formatter().parse(source):
+        literals.append(literal)
+        if field is not None:
+            fields.append(field)
+    if len(literals) == len(fields):
+        literals.append("")
+    return tuple(literals), tuple(fields)
+
+
+def _fill_template(template: tuple[tuple[str, ...], tuple[str, ...]], values: dict[str, str]) -> str:
+    literals, fields = template
+    parts = [literals[0]]
+    for field, literal in zip(fields, literals[1:]):
+        parts.append(values[field])
+        parts.append(literal)
+    return "".join(parts)
+
+
+_PAGE_TEMPLATE = _compile_template("""<!doctype html>
 <html lang=\"en\">
-{_render_head(digest.get('title', ''), css_href, site.get('meta_description', ''))}
-<body data-newsletter-mode=\"{_escape(site.get('newsletter_mode', 'local'))}\" data-newsletter-url=\"{_escape(site.get('newsletter_provider_url', ''))}\">
+{head}
+<body data-newsletter-mode=\"{newsletter_mode}\" data-newsletter-url=\"{newsletter_url}\">
   <div class=\"page-shell\">
     {header}
     <main>
-      <section class=\"page-hero\">
-        <div class=\"page-hero-inner\">
-          <p class=\"eyebrow\">Research Digest</p>
-          <h1>{_escape(digest.get('title', ''))}</h1>
-          <p class=\"post-date\">{_escape(digest.get('date', ''))}</p>
-        </div>
-      </section>
-      <section class=\"page-body\">
-        <div class=\"content-block\">
-          {body_html}
-          <a class=\"button ghost\" href=\"{_escape(back_link)}\">Back to digest</a>
-        </div>
-      </section>
+      {main}
     </main>
     {footer}
   </div>
-  <script src=\"{_escape(_rel_link(current_path, Path('assets/js/main.js')))}\"></script>
+  <script src=\"{js_href}\"></script>
 </body>
 </html>
-"""
-    output_path = SITE_DIR / current_path
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(doc, encoding="utf-8")
-
+""")
 
-def _render_blog_post(post: dict[str, str], pages: dict[str, dict[str, object]]) -> None:
-    slug = post["slug"]
-    current_path = Path("blog") / slug / "index.html"
-    css_href = _rel_link(current_path, Path("assets/css/style.css"))
-    header = _render_header("blog", pages, current_path)
-    footer = _render_footer(_read_site_config(), pages, current_path, _read_links())
-    back_link = _rel_page_link(current_path, "blog")
-    body_html = _render_paragraphs(post.get("body", ""))
-    doc = f"""<!doctype html>
-<html lang=\"en\">
-{_render_head(post.get('title', ''), css_href, _read_site_config().get('meta_description', ''))}
-<body data-newsletter-mode=\"{_escape(_read_site_config().get('newsletter_mode', 'local'))}\" data-newsletter-url=\"{_escape(_read_site_config().get('newsletter_provider_url', ''))}\">
-  <div class=\"page-shell\">
-    {header}
-    <main>
-      <section class=\"page-hero\">
+_ARTICLE_TEMPLATE = _compile_template("""<section class=\"page-hero\">
         <div class=\"page-hero-inner\">
-          <p class=\"eyebrow\">Institute Blog</p>
-          <h1>{_escape(post.get('title', ''))}</h1>
-          <p class=\"post-date\">{_escape(post.get('date', ''))}</p>
+          <p class=\"eyebrow\">{eyebrow}</p>
+          <h1>{title}</h1>
+          <p class=\"post-date\">{date}</p>
         </div>
       </section>
       <section class=\"page-body\">
         <div class=\"content-block\">
-          {body_html}
-          <a class=\"button ghost\" href=\"{_escape(back_link)}\">Back to blog</a>
+          {body}
+          <a class=\"button ghost\" href=\"{back_href}\">{back_label}</a>
         </div>
-      </section>
-    </main>
-    {footer}
-  </div>
-  <script src=\"{_escape(_rel_link(current_path, Path('assets/js/main.js')))}\"></script>
-</body>
-</html>
-"""
-    output_path = SITE_DIR / current_path
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(doc, encoding="utf-8")
-
-
-def _build_css() -> str:
-    return """
-:root {
-  color-scheme: only light;
-  --bordeaux: #65141c;
-  --bordeaux-dark: #3a1016;
-  --bordeaux-bright: #92202b;
-  --ink: #0f0f0f;
-  --paper: #f3f1f0;
-  --fog: #e4e0de;
-  --accent: #e0b15a;
-  --line: rgba(101, 20, 28, 0.14);
-  --shadow: rgba(15, 15, 15, 0.18);
-  --radius: 20px;
-  --max-width: 1120px;
-  --ease: cubic-bezier(0.2, 0.6, 0.3, 1);
-}
-
-* {
-  box-sizing: border-box;
-}
-
-body {
-  margin: 0;
-  font-family: "Work Sans", "Optima", "Gill Sans", sans-serif;
-  background: radial-gradient(circle at top, #f6f5f4 0%, var(--paper) 45%, var(--fog) 100%),
-    linear-gradient(120deg, rgba(101, 20, 28, 0.04), transparent 45%);
-  color: var(--ink);
-  line-height: 1.7;
-}
+      </section>""")
 
-a {
-  color: inherit;
-  text-decoration: none;
-}
+_NEWSLETTER_TEMPLATE = _compile_template("""
+<div class=\"newsletter\" id=\"newsletter\">
+  <div>
+    <h3>Newsletter</h3>
+    <p>Subscribe for institute updates, events, and research highlights.</p>
+  </div>
+  <form class=\"newsletter-form\" data-newsletter-form action=\"{endpoint}\" method=\"post\">
+    <label class=\"sr-only\" for=\"newsletter-email\">Email</label>
+    <input id=\"newsletter-email\" name=\"email\" type=\"email\" placeholder=\"you@example.org\" required />
+    <div class=\"sr-only\" aria-hidden=\"true\">
+      <label for=\"newsletter-company\">Company</label>
+      <input id=\"newsletter-company\" name=\"company\" type=\"text\" tabindex=\"-1\" autocomplete=\"off\" />
+    </div>
+    <button class=\"button\" type=\"submit\">Subscribe</button>
+    <p class=\"form-status\" aria-live=\"polite\"></p>
+  </form>
+</div>
+""")
 
-img {
-  max-width: 100%;
-  display: block;
-}
+_CONTACT_FORM_TEMPLATE = _compile_template("""
+<section class=\"content-section contact-section\" id=\"{section_id}\">
+  <div class=\"content-grid\">
+    <div>
+      <h2>{heading}</h2>
+      {body}
+    </div>
+    <div class=\"contact-card\">
+      <form class=\"contact-form\" data-contact-form action=\"{endpoint}\" method=\"post\">
+        <div class=\"contact-field\">
+          <label for=\"contact-name\">Name</label>
+          <input id=\"contact-name\" name=\"name\" type=\"text\" required />
+        </div>
+        <div class=\"contact-field\">
+          <label for=\"contact-email\">Email</label>
+          <input id=\"contact-email\" name=\"email\" type=\"email\" required />
+        </div>
+        <div class=\"contact-field\">
+          <label for=\"contact-message\">Message</label>
+          <textarea id=\"contact-message\" name=\"message\" rows=\"5\" required></textarea>
+        </div>
+        <div class=\"contact-field sr-only\" aria-hidden=\"true\">
+          <label for=\"contact-company\">Company</label>
+          <input id=\"contact-company\" name=\"company\" type=\"text\" tabindex=\"-1\" autocomplete=\"off\" />
+        </div>
+        <button class=\"button\" type=\"submit\">Send message</button>
+        <p class=\"form-status\" aria-live=\"polite\"></p>
+      </form>
+    </div>
+  </div>
+</section>
+""")
 
-.page-shell {
-  position: relative;
-  overflow: hidden;
-}
 
-.site-header {
-  position: sticky;
-  top: 0;
-  z-index: 10;
-  display: flex;
-  justify-content: space-between;
-  align-items: center;
-  gap: 20px;
-  padding: 18px 6vw;
-  background: rgba(247, 240, 238, 0.94);
-  backdrop-filter: blur(12px);
-  border-bottom: 1px solid var(--line);
-}
+_LINKHUB_HOME_TEMPLATE = _compile_template("""
+      <section class=\"linkhub\">
+        <div class=\"linkhub-inner\">
+          <p class=\"eyebrow\">{site_name}</p>
+          <h1>{hero_heading}</h1>
+          <p class=\"subtitle\">{site_tagline}</p>
+          {contact_blurb_paragraphs}
+          {linkhub_links}
+          {newsletter}
+        </div>
+      </section>
+""")
 
-.logo {
-  font-family: "Cormorant Garamond", "Baskerville", "Garamond", serif;
-  font-weight: 700;
-  font-size: 26px;
-  letter-spacing: 0.16em;
-  text-transform: uppercase;
-  color: var(--bordeaux);
-}
-
-.nav {
-  display: flex;
-  gap: 18px;
-  flex-wrap: wrap;
-  font-size: 13px;
-  letter-spacing: 0.12em;
-  text-transform: uppercase;
-}
-
-.nav a {
-  position: relative;
-  padding-bottom: 4px;
-}
-
-.nav a::after {
-  content: "";
-  position: absolute;
-  left: 0;
-  bottom: 0;
-  height: 2px;
-  width: 100%;
-  background: var(--bordeaux-bright);
-  transform: scaleX(0);
-  transform-origin: left;
-  transition: transform 0.3s ease;
-}
-
-.nav a:hover::after,
-.nav a:focus::after,
-.nav a.active::after {
-  transform: scaleX(1);
-}
-
-.cta {
-  padding: 10px 18px;
-  border-radius: 999px;
-  background: var(--ink);
-  color: #fff;
-  font-size: 13px;
-  text-transform: uppercase;
-  letter-spacing: 0.1em;
-}
-
-.hero {
-  position: relative;
-  padding: 110px 6vw 60px;
-  overflow: hidden;
-}
-
-.hero-inner {
-  max-width: var(--max-width);
-  margin: 0 auto;
-  display: grid;
-  grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-  gap: 40px;
-  align-items: center;
-}
-
-.eyebrow {
-  font-size: 12px;
-  text-transform: uppercase;
-  letter-spacing: 0.3em;
-  color: var(--bordeaux-dark);
-  margin: 0 0 10px;
-}
-
-.hero h1 {
-  font-family: "Cormorant Garamond", "Baskerville", "Garamond", serif;
-  font-size: clamp(40px, 6vw, 78px);
-  margin: 0 0 12px;
-  color: var(--bordeaux);
-}
-
-.hero .subtitle {
-  font-size: 18px;
-  color: var(--bordeaux-dark);
-}
-
-.hero-art {
-  position: relative;
-  background: #fff;
-  border-radius: var(--radius);
-  padding: 26px;
-  border: 1px solid var(--line);
-  box-shadow: 0 28px 48px var(--shadow);
-}
-
-.hero-art::before {
-  content: "";
-  position: absolute;
-  inset: -40% -20% auto auto;
-  height: 260px;
-  width: 260px;
-  background: radial-gradient(circle, rgba(163, 22, 33, 0.45), transparent 70%);
-  filter: blur(4px);
-  animation: orbit 14s ease-in-out infinite;
-  z-index: 0;
-}
-
-.hero-art > * {
-  position: relative;
-  z-index: 1;
-}
-
-.hero-orbit {
-  position: absolute;
-  inset: 0;
-  background: radial-gradient(circle at 70% 20%, rgba(107, 15, 26, 0.18), transparent 40%),
-    radial-gradient(circle at 20% 80%, rgba(224, 177, 90, 0.2), transparent 50%);
-  animation: pulse 12s ease-in-out infinite;
-  z-index: 0;
-}
-
-.hero-metrics {
-  display: grid;
-  grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-  gap: 12px;
-  font-size: 12px;
-  text-transform: uppercase;
-  letter-spacing: 0.08em;
-}
-
-.hero-metrics span {
-  display: block;
-  font-size: 24px;
-  font-weight: 600;
-  color: var(--bordeaux);
-}
-
-.button {
-  display: inline-flex;
-  align-items: center;
-  gap: 8px;
-  padding: 12px 20px;
-  border-radius: 999px;
-  border: none;
-  background: var(--bordeaux);
-  color: #fff;
-  text-transform: uppercase;
-  letter-spacing: 0.08em;
-  font-size: 13px;
-  box-shadow: 0 14px 30px var(--shadow);
-  cursor: pointer;
-  transition: transform 0.3s var(--ease), box-shadow 0.3s var(--ease);
-}
-
-.button.ghost {
-  background: transparent;
-  color: var(--bordeaux);
-  border: 1px solid var(--bordeaux);
-  box-shadow: none;
-}
-
-.button:hover {
-  transform: translateY(-2px);
-  box-shadow: 0 18px 36px var(--shadow);
-}
-
-.content-section {
-  padding: 20px 6vw 60px;
-}
-
-.content-grid {
-  max-width: var(--max-width);
-  margin: 0 auto;
-  display: grid;
-  grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
-  gap: 28px;
-  align-items: center;
-}
-
-.content-section h2 {
-  font-family: "Cormorant Garamond", "Baskerville", "Garamond", serif;
-  font-size: clamp(26px, 3.4vw, 40px);
-  color: var(--bordeaux);
-}
-
-.image-frame {
-  background: #fff;
-  border-radius: var(--radius);
-  padding: 14px;
-  border: 1px solid var(--line);
-  box-shadow: 0 18px 36px var(--shadow);
-}
-
-.card-grid {
-  display: grid;
-  grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-  gap: 18px;
-}
-
-.card {
-  background: #fff;
-  border-radius: var(--radius);
-  padding: 18px;
-  border: 1px solid var(--line);
-  box-shadow: 0 16px 30px var(--shadow);
-  transition: transform 0.35s var(--ease), box-shadow 0.35s var(--ease);
-}
-
-.card:hover {
-  transform: translateY(-6px) scale(1.01);
-  box-shadow: 0 20px 40px var(--shadow);
-}
-
-.card.wide {
-  grid-column: 1 / -1;
-}
-
-.linkhub {
-  padding: 120px 6vw 80px;
-}
-
-.linkhub-inner {
-  max-width: 720px;
-  margin: 0 auto;
-  display: grid;
-  gap: 24px;
-}
-
-.linkhub-links {
-  display: grid;
-  gap: 14px;
-}
-
-.linkhub-link {
-  display: block;
-  padding: 16px 18px;
-  border-radius: var(--radius);
-  border: 1px solid var(--line);
-  background: #fff;
-  text-transform: uppercase;
-  letter-spacing: 0.08em;
-  font-size: 13px;
-  box-shadow: 0 16px 30px var(--shadow);
-}
-
-.linkhub-link.placeholder {
-  opacity: 0.7;
-}
-
-.profile-section {
-  padding: 60px 6vw 80px;
-}
-
-.profile-grid {
-  max-width: var(--max-width);
-  margin: 0 auto;
-  display: grid;
-  grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-  gap: 18px;
-}
-
-.profile-card {
-  background: #fff;
-  border-radius: var(--radius);
-  border: 1px solid var(--line);
-  padding: 18px;
-  box-shadow: 0 16px 30px var(--shadow);
-}
-
-.outputs-list {
-  list-style: none;
-  padding: 0;
-  margin: 0;
-  display: grid;
-  gap: 12px;
-}
-
-.outputs-list li {
-  padding: 12px 14px;
-  border-radius: 14px;
-  border: 1px solid var(--line);
-  background: rgba(255, 255, 255, 0.9);
-}
-
-.page-hero {
-  padding: 110px 6vw 40px;
-}
-
-.page-hero-inner {
-  max-width: var(--max-width);
-  margin: 0 auto;
-}
-
-.page-hero h1 {
-  font-family: "Cormorant Garamond", "Baskerville", "Garamond", serif;
-  font-size: clamp(36px, 5vw, 64px);
-  color: var(--bordeaux);
-  margin: 0 0 10px;
-}
-
-.page-body {
-  padding: 10px 6vw 80px;
-}
-
-.content-block {
-  max-width: var(--max-width);
-  margin: 0 auto;
-  background: #fff;
-  border-radius: var(--radius);
-  padding: clamp(24px, 4vw, 44px);
-  border: 1px solid var(--line);
-  box-shadow: 0 18px 36px var(--shadow);
-  display: grid;
-  gap: 18px;
-}
-
-.post-grid {
-  display: grid;
-  gap: 16px;
-}
-
-.post-card {
-  border: 1px solid var(--line);
-  border-radius: var(--radius);
-  padding: 18px;
-  background: #fff;
-  box-shadow: 0 16px 30px var(--shadow);
-}
-
-.post-date {
-  font-size: 12px;
-  letter-spacing: 0.12em;
-  text-transform: uppercase;
-  color: var(--bordeaux-dark);
-}
-
-.tag-list {
-  display: flex;
-  flex-wrap: wrap;
-  gap: 10px;
-}
-
-.tag {
-  padding: 6px 12px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  font-size: 12px;
-  letter-spacing: 0.08em;
-  text-transform: uppercase;
-  color: var(--bordeaux-dark);
-}
-
-.tag.primary {
-  background: var(--bordeaux);
-  color: #fff;
-}
-
-.newsletter {
-  margin-top: 18px;
-  padding: 18px;
-  border-radius: var(--radius);
-  border: 1px solid var(--line);
-  background: rgba(255, 255, 255, 0.9);
-  display: grid;
-  gap: 10px;
-}
-
-.newsletter-form {
-  display: flex;
-  flex-wrap: wrap;
-  gap: 10px;
-  align-items: center;
-}
-
-.newsletter-form input {
-  flex: 1 1 220px;
-  padding: 12px 14px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  font-size: 14px;
-}
-
-.contact-section .content-grid {
-  align-items: flex-start;
-}
-
-.contact-card {
-  background: #fff;
-  border-radius: var(--radius);
-  border: 1px solid var(--line);
-  box-shadow: 0 18px 36px var(--shadow);
-  padding: clamp(20px, 3vw, 32px);
-}
-
-.contact-form {
-  display: grid;
-  gap: 14px;
-}
-
-.contact-field {
-  display: grid;
-  gap: 6px;
-}
-
-.contact-field input,
-.contact-field textarea {
-  width: 100%;
-  padding: 12px 14px;
-  border-radius: 14px;
-  border: 1px solid var(--line);
-  font-size: 14px;
-  font-family: inherit;
-}
-
-.contact-field textarea {
-  resize: vertical;
-  min-height: 140px;
-}
-
-.digest-grid {
-  display: grid;
-  gap: 14px;
-}
-
-.digest-card {
-  border: 1px solid var(--line);
-  border-radius: var(--radius);
-  padding: 16px;
-  background: #fff;
-  box-shadow: 0 16px 30px var(--shadow);
-  transition: transform 0.3s var(--ease), box-shadow 0.3s var(--ease);
-}
-
-.digest-card:hover {
-  transform: translateY(-4px);
-  box-shadow: 0 20px 40px var(--shadow);
-}
-
-.form-status {
-  font-size: 13px;
-  color: var(--bordeaux-dark);
-}
-
-.site-footer {
-  padding: 60px 6vw 80px;
-  border-top: 1px solid var(--line);
-  background: rgba(247, 240, 238, 0.7);
-}
-
-.footer-grid {
-  max-width: var(--max-width);
-  margin: 0 auto;
-  display: grid;
-  grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-  gap: 24px;
-}
-
-.footer-title {
-  font-family: "Cormorant Garamond", "Baskerville", "Garamond", serif;
-  color: var(--bordeaux);
-  font-size: 18px;
-  margin-bottom: 8px;
-}
-
-.footer-links {
-  display: grid;
-  gap: 8px;
-}
-
-.reveal {
-  opacity: 0;
-  transform: translateY(18px);
-  transition: opacity 0.6s ease, transform 0.6s ease;
-}
-
-.reveal.is-visible {
-  opacity: 1;
-  transform: translateY(0);
-}
-
-.sr-only {
-  position: absolute;
-  width: 1px;
-  height: 1px;
-  padding: 0;
-  margin: -1px;
-  overflow: hidden;
-  clip: rect(0, 0, 0, 0);
-  border: 0;
-}
-
-@keyframes orbit {
-  0% { transform: translate3d(0, 0, 0); }
-  50% { transform: translate3d(-30px, 20px, 0); }
-  100% { transform: translate3d(0, 0, 0); }
-}
-
-@keyframes pulse {
-  0% { opacity: 0.7; }
-  50% { opacity: 1; }
-  100% { opacity: 0.7; }
-}
-
-@media (max-width: 860px) {
-  .site-header {
-    position: static;
-    flex-direction: column;
-    align-items: flex-start;
-  }
-
-  .cta {
-    align-self: stretch;
-    text-align: center;
-  }
-}
-
-@media (max-width: 600px) {
-  .hero {
-    padding-top: 80px;
-  }
-
-  .hero-inner {
-    gap: 24px;
-  }
-}
-""".lstrip()
-
-
-def _build_js() -> str:
-    return """
-const prefersReduced = window.matchMedia('(prefers-reduced-motion: reduce)').matches;
-
-function revealOnScroll() {
-  const revealItems = document.querySelectorAll('.reveal');
-  if (prefersReduced) {
-    revealItems.forEach((item) => item.classList.add('is-visible'));
-    return;
-  }
-  const observer = new IntersectionObserver((entries) => {
-    entries.forEach((entry) => {
-      if (entry.isIntersecting) {
-        entry.target.classList.add('is-visible');
-        observer.unobserve(entry.target);
-      }
-    });
-  }, { threshold: 0.2 });
-
-  revealItems.forEach((item) => observer.observe(item));
-}
-
-function smoothScroll() {
-  document.querySelectorAll('a[href^="#"]').forEach((link) => {
-    link.addEventListener('click', (event) => {
-      const targetId = link.getAttribute('href');
-      if (!targetId || targetId.length < 2) return;
-      const target = document.querySelector(targetId);
-      if (!target) return;
-      event.preventDefault();
-      target.scrollIntoView({ behavior: prefersReduced ? 'auto' : 'smooth' });
-    });
-  });
-}
-
-function setupNewsletter() {
-  const form = document.querySelector('[data-newsletter-form]');
-  if (!form) return;
-  const status = form.querySelector('.form-status');
-  const body = document.body;
-  const mode = body.dataset.newsletterMode || 'local';
-  const providerUrl = body.dataset.newsletterUrl || '';
-  form.addEventListener('submit', async (event) => {
-    if (mode !== 'local' && !providerUrl) return;
-    event.preventDefault();
-    const emailInput = form.querySelector('input[name="email"]');
-    const email = emailInput ? emailInput.value.trim() : '';
-    if (!email) {
-      status.textContent = 'Please enter a valid email.';
-      return;
-    }
-    const companyInput = form.querySelector('input[name="company"]');
-    const company = companyInput ? companyInput.value.trim() : '';
-    const endpoint = mode === 'local' || !providerUrl ? form.getAttribute('action') : providerUrl;
-    if (!endpoint) {
-      status.textContent = 'Newsletter endpoint is not configured.';
-      return;
-    }
-    status.textContent = 'Submitting...';
-    try {
-      const response = await fetch(endpoint, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
-        body: new URLSearchParams({ email, company })
-      });
-      const payload = await response.json().catch(() => ({}));
-      if (response.ok && payload.ok) {
-        status.textContent = 'Thanks for subscribing.';
-        form.reset();
-      } else {
-        status.textContent = payload.error || 'Subscription failed. Please try again.';
-      }
-    } catch (error) {
-      status.textContent = 'Subscription failed. Please try again.';
-    }
-  });
-}
-
-function setupContactForm() {
-  const form = document.querySelector('[data-contact-form]');
-  if (!form) return;
-  const status = form.querySelector('.form-status');
-  form.addEventListener('submit', async (event) => {
-    event.preventDefault();
-    const nameInput = form.querySelector('input[name="name"]');
-    const emailInput = form.querySelector('input[name="email"]');
-    const messageInput = form.querySelector('textarea[name="message"]');
-    const companyInput = form.querySelector('input[name="company"]');
-    const name = nameInput ? nameInput.value.trim() : '';
-    const email = emailInput ? emailInput.value.trim() : '';
-    const message = messageInput ? messageInput.value.trim() : '';
-    const company = companyInput ? companyInput.value.trim() : '';
-    if (!name || !email || !message) {
-      status.textContent = 'Please complete all required fields.';
-      return;
-    }
-    const endpoint = form.getAttribute('action');
-    if (!endpoint) {
-      status.textContent = 'Contact endpoint is not configured.';
-      return;
-    }
-    status.textContent = 'Sending...';
-    try {
-      const response = await fetch(endpoint, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
-        body: new URLSearchParams({ name, email, message, company })
-      });
-      const payload = await response.json().catch(() => ({}));
-      if (response.ok && payload.ok) {
-        status.textContent = 'Message sent. Thank you.';
-        form.reset();
-      } else {
-        status.textContent = payload.error || 'Message failed. Please try again.';
-      }
-    } catch (error) {
-      status.textContent = 'Message failed. Please try again.';
-    }
-  });
-}
-
-window.addEventListener('DOMContentLoaded', () => {
-  revealOnScroll();
-  smoothScroll();
-  setupNewsletter();
-  setupContactForm();
-});
-""".lstrip()
-
-
-def _build_placeholder_svg(label: str) -> str:
-    safe_label = _escape(label)
-    return f"""<svg xmlns=\"http://www.w3.org/2000/svg\" viewBox=\"0 0 600 400\" role=\"img\" aria-label=\"{safe_label}\">
-  <defs>
-    <linearGradient id=\"g\" x1=\"0\" y1=\"0\" x2=\"1\" y2=\"1\">
-      <stop offset=\"0%\" stop-color=\"#6b0f1a\" stop-opacity=\"0.2\" />
-      <stop offset=\"100%\" stop-color=\"#e0b15a\" stop-opacity=\"0.3\" />
-    </linearGradient>
-  </defs>
-  <rect width=\"600\" height=\"400\" fill=\"#f4ecea\" />
-  <rect x=\"40\" y=\"40\" width=\"520\" height=\"320\" fill=\"url(#g)\" rx=\"26\" />
-  <circle cx=\"470\" cy=\"130\" r=\"70\" fill=\"#6b0f1a\" fill-opacity=\"0.16\" />
-  <rect x=\"120\" y=\"230\" width=\"240\" height=\"18\" rx=\"9\" fill=\"#6b0f1a\" fill-opacity=\"0.25\" />
-  <rect x=\"120\" y=\"260\" width=\"180\" height=\"12\" rx=\"6\" fill=\"#0f0f0f\" fill-opacity=\"0.2\" />
-  <text x=\"120\" y=\"205\" fill=\"#3e0a11\" font-family=\"Georgia, serif\" font-size=\"22\">{safe_label}</text>
-</svg>
-"""
-
-
-def _write_site_assets() -> None:
-    CSS_DIR.mkdir(parents=True, exist_ok=True)
-    JS_DIR.mkdir(parents=True, exist_ok=True)
-    IMG_DIR.mkdir(parents=True, exist_ok=True)
-    (CSS_DIR / "style.css").write_text(_build_css(), encoding="utf-8")
-    (JS_DIR / "main.js").write_text(_build_js(), encoding="utf-8")
-    for name, label in PLACEHOLDER_IMAGES.items():
-        (IMG_DIR / name).write_text(_build_placeholder_svg(label), encoding="utf-8")
-    if MEDIA_DIR.exists():
-        for path in MEDIA_DIR.rglob("*"):
-            if path.is_dir():
-                continue
-            target = IMG_DIR / path.relative_to(MEDIA_DIR)
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(path, target)
-
-
-def _write_subscribe_php() -> None:
-    php = """<?php
-header('Content-Type: application/json');
-
-function fail($code, $error) {
-  http_response_code($code);
-  echo json_encode(['ok' => false, 'error' => $error]);
-  exit;
-}
-
-if ($_SERVER['REQUEST_METHOD'] !== 'POST') {
-  fail(405, 'method_not_allowed');
-}
-
-$honeypot = trim($_POST['company'] ?? '');
-if ($honeypot !== '') {
-  fail(400, 'invalid_request');
-}
-
-$email = trim($_POST['email'] ?? '');
-if (!filter_var($email, FILTER_VALIDATE_EMAIL)) {
-  fail(400, 'invalid_email');
-}
-
-$dataDir = __DIR__ . '/data';
-if (!is_dir($dataDir)) {
-  mkdir($dataDir, 0750, true);
-}
-
-$rateFile = $dataDir . '/ratelimit.json';
-$ip = $_SERVER['REMOTE_ADDR'] ?? 'unknown';
-$now = time();
-$window = 3600;
-$limit = 8;
-
-$rateHandle = fopen($rateFile, 'c+');
-if (!$rateHandle) {
-  fail(500, 'storage_unavailable');
-}
-flock($rateHandle, LOCK_EX);
-$contents = stream_get_contents($rateHandle);
-$rateData = $contents ? json_decode($contents, true) : [];
-if (!is_array($rateData)) {
-  $rateData = [];
-}
-$entries = $rateData[$ip] ?? [];
-$entries = array_values(array_filter($entries, function($ts) use ($now, $window) {
-  return $ts >= ($now - $window);
-}));
-if (count($entries) >= $limit) {
-  flock($rateHandle, LOCK_UN);
-  fclose($rateHandle);
-  fail(429, 'rate_limited');
-}
-$entries[] = $now;
-$rateData[$ip] = $entries;
-rewind($rateHandle);
-ftruncate($rateHandle, 0);
-fwrite($rateHandle, json_encode($rateData, JSON_PRETTY_PRINT));
-flock($rateHandle, LOCK_UN);
-fclose($rateHandle);
-
-$file = $dataDir . '/newsletter_signups.csv';
-$handle = fopen($file, 'a');
-if (!$handle) {
-  fail(500, 'storage_unavailable');
-}
-flock($handle, LOCK_EX);
-fputcsv($handle, [gmdate('c'), $email, $ip]);
-flock($handle, LOCK_UN);
-fclose($handle);
-
-echo json_encode(['ok' => true]);
-"""
-    (SITE_DIR / "subscribe.php").write_text(php, encoding="utf-8")
-
-
-def _write_contact_php() -> None:
-    php = """<?php
-header('Content-Type: application/json');
-
-function fail($code, $error) {
-  http_response_code($code);
-  echo json_encode(['ok' => false, 'error' => $error]);
-  exit;
-}
-
-if ($_SERVER['REQUEST_METHOD'] !== 'POST') {
-  fail(405, 'method_not_allowed');
-}
-
-$honeypot = trim($_POST['company'] ?? '');
-if ($honeypot !== '') {
-  fail(400, 'invalid_request');
-}
-
-$name = trim($_POST['name'] ?? '');
-$email = trim($_POST['email'] ?? '');
-$message = trim($_POST['message'] ?? '');
-
-if ($name === '' || $email === '' || $message === '') {
-  fail(400, 'missing_fields');
-}
-if (!filter_var($email, FILTER_VALIDATE_EMAIL)) {
-  fail(400, 'invalid_email');
-}
-if (mb_strlen($message) > 4000) {
-  fail(400, 'message_too_long');
-}
-
-$dataDir = __DIR__ . '/data';
-if (!is_dir($dataDir)) {
-  mkdir($dataDir, 0750, true);
-}
-
-$rateFile = $dataDir . '/ratelimit.json';
-$ip = $_SERVER['REMOTE_ADDR'] ?? 'unknown';
-$now = time();
-$window = 3600;
-$limit = 6;
-
-$rateHandle = fopen($rateFile, 'c+');
-if (!$rateHandle) {
-  fail(500, 'storage_unavailable');
-}
-flock($rateHandle, LOCK_EX);
-$contents = stream_get_contents($rateHandle);
-$rateData = $contents ? json_decode($contents, true) : [];
-if (!is_array($rateData)) {
-  $rateData = [];
-}
-$entries = $rateData[$ip] ?? [];
-$entries = array_values(array_filter($entries, function($ts) use ($now, $window) {
-  return $ts >= ($now - $window);
-}));
-if (count($entries) >= $limit) {
-  flock($rateHandle, LOCK_UN);
-  fclose($rateHandle);
-  fail(429, 'rate_limited');
-}
-$entries[] = $now;
-$rateData[$ip] = $entries;
-rewind($rateHandle);
-ftruncate($rateHandle, 0);
-fwrite($rateHandle, json_encode($rateData, JSON_PRETTY_PRINT));
-flock($rateHandle, LOCK_UN);
-fclose($rateHandle);
-
-$file = $dataDir . '/contact_messages.csv';
-$handle = fopen($file, 'a');
-if (!$handle) {
-  fail(500, 'storage_unavailable');
-}
-flock($handle, LOCK_EX);
-fputcsv($handle, [gmdate('c'), $name, $email, $message, $ip]);
-flock($handle, LOCK_UN);
-fclose($handle);
-
-echo json_encode(['ok' => true]);
-"""
-    (SITE_DIR / "contact.php").write_text(php, encoding="utf-8")
-
-
-def _write_data_protection() -> None:
-    data_dir = SITE_DIR / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    htaccess = """Require all denied
-<FilesMatch "\\.(csv|json)$">
-  Require all denied
-</FilesMatch>
-"""
-    (data_dir / ".htaccess").write_text(htaccess, encoding="utf-8")
-
-
-def build_site() -> None:
-    pages = _read_control()
-    site = _read_site_config()
-    links = _read_links()
-    posts = _read_blog_posts()
-    digests = _read_digests()
-    meta_description = site.get("meta_description", "")
-    layout_variant = (site.get("layout_variant") or "standard").strip().lower()
-    if layout_variant not in {"standard", "linkhub", "profile"}:
-        layout_variant = "standard"
-    show_digest_home = str(site.get("show_digest_home", "")).strip().lower() in {"1", "true", "yes", "on"}
-
-    if SITE_DIR.exists():
-        shutil.rmtree(SITE_DIR)
-    SITE_DIR.mkdir(parents=True, exist_ok=True)
-    _write_site_assets()
-    _write_subscribe_php()
-    _write_contact_php()
-    _write_data_protection()
-
-    for slug, page in sorted(pages.items(), key=lambda item: item[1].get("order", 0)):
-        current_path = _page_output_path(slug)
-        css_href = _rel_link(current_path, Path("assets/css/style.css"))
-        js_href = _rel_link(current_path, Path("assets/js/main.js"))
-        header = _render_header(slug, pages, current_path)
-        footer = _render_footer(site, pages, current_path, links)
-        sections = list(page["sections"])
-        if slug == "" and not show_digest_home:
-            sections = [section for section in sections if section.get("kind") != "digest_list"]
-        hero = next((section for section in sections if section.get("kind") == "hero"), sections[0] if sections else {})
-        hero_heading = hero.get("title") or page["title"]
-        hero_body = _render_markdown(_read_block(hero.get("source_md", "")))
-        hero_cta_text = _escape(hero.get("cta_text", ""))
-        hero_cta_url = _resolve_cta_url(hero.get("cta_url", ""), pages, current_path)
-        hero_cta = ""
-        if hero_cta_text and hero_cta_url:
-            hero_cta = f"<a class=\"button\" href=\"{_escape(hero_cta_url)}\">{hero_cta_text}</a>"
-        hero_image_src = _resolve_image_src(hero.get("hero_image", ""), current_path)
-
-        content_sections = [section for section in sections if section is not hero]
-        sections_html = "".join(
-            _render_section(section, current_path, pages, digests)
-            for section in content_sections
-        )
-
-        newsletter_html = ""
-        if slug in {"", "contact", "digest"}:
-            newsletter_html = _render_newsletter_form(site, current_path)
-
-        overview_html = ""
-        if slug == "":
-            overview_html = _render_home_overview(pages, current_path)
-
-        blog_index_html = ""
-        if slug == "blog":
-            blog_index_html = _render_blog_index(posts, current_path)
-
-        digest_index_html = ""
-        if slug == "digest":
-            digest_index_html = _render_digest_index(digests, current_path)
-
-        contact_links_html = _render_links(links) if slug == "contact" else ""
-        page_body_inner = "".join([blog_index_html, digest_index_html, newsletter_html, contact_links_html]).strip()
-        page_body_html = ""
-        if page_body_inner:
-            page_body_html = f"""
-      <section class=\"page-body\">
-        <div class=\"content-block reveal\">
-          {page_body_inner}
-        </div>
-      </section>"""
-
-        if slug == "":
-            if layout_variant == "linkhub":
-                homepage_body = f"""
-      <section class=\"linkhub\">
-        <div class=\"linkhub-inner\">
-          <p class=\"eyebrow\">{_escape(site.get('site_name', 'Artificial Life Institute'))}</p>
-          <h1>{_escape(hero_heading)}</h1>
-          <p class=\"subtitle\">{_escape(site.get('site_tagline', ''))}</p>
-          {_render_paragraphs(site.get('contact_blurb', ''))}
-          {_render_linkhub_links(links)}
-          {newsletter_html}
-        </div>
-      </section>
-"""
-            elif layout_variant == "profile":
-                homepage_body = f"""
+_PROFILE_HOME_TEMPLATE = _compile_template("""
       <section class=\"hero\">
         <div class=\"hero-orbit\"></div>
         <div class=\"hero-inner\">
           <div>
-            <p class=\"eyebrow\">{_escape(site.get('site_name', 'Artificial Life Institute'))}</p>
-            <h1>{_escape(hero_heading)}</h1>
-            <p class=\"subtitle\">{_escape(site.get('site_tagline', ''))}</p>
+            <p class=\"eyebrow\">{site_name}</p>
+            <h1>{hero_heading}</h1>
+            <p class=\"subtitle\">{site_tagline}</p>
             {hero_body}
             <div class=\"hero-actions\">{hero_cta}</div>
           </div>
           <div class=\"hero-art\">
-            <figure class=\"image-frame\"><img src=\"{_escape(hero_image_src)}\" alt=\"{_escape(hero_heading)} image\" /></figure>
+            <figure class=\"image-frame\"><img src=\"{hero_image_src}\" alt=\"{hero_heading} image\" /></figure>
             <h3>Institute profile</h3>
-            <p>{_escape(site.get('contact_blurb', ''))}</p>
+            <p>{contact_blurb}</p>
           </div>
         </div>
       </section>
@@ -1744,24 +987,24 @@ def build_site() -> None:
             <li>Placeholder output: workshop, symposium, or lecture series.</li>
             <li>Placeholder output: open-source tool or platform.</li>
           </ul>
-          {newsletter_html}
+          {newsletter}
         </div>
       </section>
-"""
-            else:
-                homepage_body = f"""
+""")
+
+_PAGE_HERO_TEMPLATE = _compile_template("""
       <section class=\"hero\">
         <div class=\"hero-orbit\"></div>
         <div class=\"hero-inner\">
           <div>
-            <p class=\"eyebrow\">{_escape(site.get('site_name', 'Artificial Life Institute'))}</p>
-            <h1>{_escape(hero_heading)}</h1>
-            <p class=\"subtitle\">{_escape(site.get('site_tagline', ''))}</p>
+            <p class=\"eyebrow\">{site_name}</p>
+            <h1>{hero_heading}</h1>
+            <p class=\"subtitle\">{site_tagline}</p>
             {hero_body}
             <div class=\"hero-actions\">{hero_cta}</div>
           </div>
           <div class=\"hero-art\">
-            <figure class=\"image-frame\"><img src=\"{_escape(hero_image_src)}\" alt=\"{_escape(hero_heading)} image\" /></figure>
+            <figure class=\"image-frame\"><img src=\"{hero_image_src}\" alt=\"{hero_heading} image\" /></figure>
             <h3>Dynamic systems, grounded experiments</h3>
             <p>Placeholder for a concise, compelling institute statement.</p>
             <div class=\"hero-metrics\">
@@ -1772,64 +1015,285 @@ def build_site() -> None:
           </div>
         </div>
       </section>
-      {overview_html}
-      {sections_html}
-      {page_body_html}
-"""
-        else:
-            homepage_body = f"""
-      <section class=\"hero\">
-        <div class=\"hero-orbit\"></div>
-        <div class=\"hero-inner\">
-          <div>
-            <p class=\"eyebrow\">{_escape(site.get('site_name', 'Artificial Life Institute'))}</p>
-            <h1>{_escape(hero_heading)}</h1>
-            <p class=\"subtitle\">{_escape(site.get('site_tagline', ''))}</p>
-            {hero_body}
-            <div class=\"hero-actions\">{hero_cta}</div>
-          </div>
-          <div class=\"hero-art\">
-            <figure class=\"image-frame\"><img src=\"{_escape(hero_image_src)}\" alt=\"{_escape(hero_heading)} image\" /></figure>
-            <h3>Dynamic systems, grounded experiments</h3>
-            <p>Placeholder for a concise, compelling institute statement.</p>
-            <div class=\"hero-metrics\">
-              <div><span>12+</span>Active research threads</div>
-              <div><span>4</span>Cross-faculty labs</div>
-              <div><span>20</span>Years of ALife history</div>
-            </div>
-          </div>
+      {overview}
+      {sections}
+      {page_body}
+""")
+
+def _render_document(
+    title: str,
+    current_path: Path,
+    site: dict[str, str],
+    header: str,
+    main: str,
+    footer: str,
+) -> str:
+    css_href = _rel_link(current_path, STYLE_CSS)
+    js_href = _rel_link(current_path, MAIN_JS)
+    return _fill_template(
+        _PAGE_TEMPLATE,
+        {
+            "head": _render_head(title, css_href, site["meta_description_html"]),
+            "newsletter_mode": site["newsletter_mode_html"],
+            "newsletter_url": site["newsletter_url_html"],
+            "header": header,
+            "main": main,
+            "footer": footer,
+            "js_href": _escape(js_href),
+        },
+    )
+
+
+def _render_digest_page(digest: dict[str, str], pages: dict[str, dict[str, object]], nav: dict[str, str], site: dict[str, str], links: list[dict[str, str]]) -> None:
+    slug = digest["slug"]
+    current_path = Path("digest") / slug / "index.html"
+    header = _render_header("digest", nav, current_path)
+    footer = _render_footer(site, pages, current_path, links)
+    back_link = _rel_page_link(current_path, "digest")
+    main = _fill_template(
+        _ARTICLE_TEMPLATE,
+        {
+            "eyebrow": "Research Digest",
+            "title": digest["title_html"],
+            "date": digest["date_html"],
+            "body": _render_block(digest.get("source_md", "")),
+            "back_href": _escape(back_link),
+            "back_label": "Back to digest",
+        },
+    )
+    doc = _render_document(digest.get("title", ""), current_path, site, header, main, footer)
+    _write_page(current_path, doc)
+
+
+def _render_blog_post(post: dict[str, str], pages: dict[str, dict[str, object]], nav: dict[str, str], site: dict[str, str], links: list[dict[str, str]]) -> None:
+    slug = post["slug"]
+    current_path = Path("blog") / slug / "index.html"
+    header = _render_header("blog", nav, current_path)
+    footer = _render_footer(site, pages, current_path, links)
+    back_link = _rel_page_link(current_path, "blog")
+    main = _fill_template(
+        _ARTICLE_TEMPLATE,
+        {
+            "eyebrow": "Institute Blog",
+            "title": post["title_html"],
+            "date": post["date_html"],
+            "body": post["body_html"],
+            "back_href": _escape(back_link),
+            "back_label": "Back to blog",
+        },
+    )
+    doc = _render_document(post.get("title", ""), current_path, site, header, main, footer)
+    _write_page(current_path, doc)
+
+
+def _copy_if_changed(source: str, target: str) -> str:
+    source_stat = os.stat(source)
+    _OUTPUTS[Path(target)] = [None, source_stat.st_size, source_stat.st_mtime_ns]
+    try:
+        target_stat = os.stat(target)
+    except FileNotFoundError:
+        pass
+    else:
+        if (target_stat.st_size, target_stat.st_mtime_ns) == (source_stat.st_size, source_stat.st_mtime_ns):
+            return target
+    return shutil.copy2(source, target)
+
+
+def _write_site_assets() -> None:
+    _write_if_changed(SITE_DIR / STYLE_CSS, (ASSET_SOURCES_DIR / "style.css").read_bytes())
+    _write_if_changed(SITE_DIR / MAIN_JS, (ASSET_SOURCES_DIR / "main.js").read_bytes())
+    placeholder = (ASSET_SOURCES_DIR / "placeholder.svg").read_text(encoding="utf-8")
+    for name, label in PLACEHOLDER_IMAGES.items():
+        _write_if_changed(IMG_DIR / name, placeholder.replace("__LABEL__", _escape(label)).encode("utf-8"))
+    if MEDIA_DIR.exists():
+        shutil.copytree(MEDIA_DIR, IMG_DIR, dirs_exist_ok=True, copy_function=_copy_if_changed)
+
+
+def _write_server_files() -> None:
+    for target, source in SERVER_FILES.items():
+        _write_if_changed(SITE_DIR / target, (ASSET_SOURCES_DIR / source).read_bytes())
+
+
+def _render_linkhub_layout(values: dict[str, str], site: dict[str, str], links: list[dict[str, str]]) -> str:
+    values["contact_blurb_paragraphs"] = site["contact_blurb_paragraphs_html"]
+    values["linkhub_links"] = _render_linkhub_links(links)
+    return _fill_template(_LINKHUB_HOME_TEMPLATE, values)
+
+
+def _render_profile_layout(values: dict[str, str], site: dict[str, str], links: list[dict[str, str]]) -> str:
+    values["contact_blurb"] = site["contact_blurb_html"]
+    return _fill_template(_PROFILE_HOME_TEMPLATE, values)
+
+
+def _render_hero_layout(values: dict[str, str], site: dict[str, str], links: list[dict[str, str]]) -> str:
+    return _fill_template(_PAGE_HERO_TEMPLATE, values)
+
+
+_PAGE_LAYOUTS = {
+    ("", "linkhub"): _render_linkhub_layout,
+    ("", "profile"): _render_profile_layout,
+}
+
+
+_PAGE_EXTRA_RENDERERS = {
+    "overview": lambda current_path, nav, site, links, posts, digests: _render_home_overview(nav, current_path),
+    "blog_index": lambda current_path, nav, site, links, posts, digests: _render_blog_index(posts, current_path),
+    "digest_index": lambda current_path, nav, site, links, posts, digests: _render_digest_index(digests, current_path),
+    "newsletter": lambda current_path, nav, site, links, posts, digests: _render_newsletter_form(site, current_path),
+    "contact_links": lambda current_path, nav, site, links, posts, digests: _render_links(links),
+}
+
+_PAGE_EXTRAS = {
+    "": ("overview", "newsletter"),
+    "blog": ("blog_index",),
+    "digest": ("digest_index", "newsletter"),
+    "contact": ("newsletter", "contact_links"),
+}
+
+
+def _render_page(slug: str, page: dict[str, object], pages: dict[str, dict[str, object]], nav: dict[str, str], site: dict[str, str], links: list[dict[str, str]], posts: list[dict[str, str]], digests: list[dict[str, str]], layout_variant: str, show_digest_home: bool) -> None:
+    current_path = _page_output_path(slug)
+    header = _render_header(slug, nav, current_path)
+    footer = _render_footer(site, pages, current_path, links)
+    sections = page["sections"]
+    if slug == "" and not show_digest_home:
+        sections = [section for section in sections if section["kind"] != "digest_list"]
+    hero = next((section for section in sections if section["kind"] == "hero"), sections[0] if sections else _SECTION_DEFAULTS)
+    hero_heading = hero["title"] or page["title"]
+    hero_body = _render_block(hero["source_md"]) if hero["source_md"] else ""
+    hero_cta_text = _escape(hero["cta_text"])
+    hero_cta = ""
+    hero_cta_url = _resolve_cta_url(hero["cta_url"], pages, current_path) if hero_cta_text else ""
+    if hero_cta_url:
+        hero_cta = f"<a class=\"button\" href=\"{_escape(hero_cta_url)}\">{hero_cta_text}</a>"
+    hero_image_src = _resolve_image_src(hero["hero_image"], current_path)
+
+    content_sections = [section for section in sections if section is not hero]
+    sections_html = "".join(
+        _render_section(section, current_path, pages, digests)
+        for section in content_sections
+    )
+
+    extras = {
+        name: _PAGE_EXTRA_RENDERERS[name](current_path, nav, site, links, posts, digests)
+        for name in _PAGE_EXTRAS.get(slug, ())
+    }
+    newsletter_html = extras.get("newsletter", "")
+    overview_html = extras.pop("overview", "")
+    page_body_inner = "".join(extras.values()).strip()
+    page_body_html = ""
+    if page_body_inner:
+        page_body_html = f"""
+      <section class=\"page-body\">
+        <div class=\"content-block reveal\">
+          {page_body_inner}
         </div>
-      </section>
-      {overview_html}
-      {sections_html}
-      {page_body_html}
-"""
+      </section>"""
 
-        doc = f"""<!doctype html>
-<html lang=\"en\">
-{_render_head(page['title'], css_href, meta_description)}
-<body data-newsletter-mode=\"{_escape(site.get('newsletter_mode', 'local'))}\" data-newsletter-url=\"{_escape(site.get('newsletter_provider_url', ''))}\">
-  <div class=\"page-shell\">
-    {header}
-    <main>
-      {homepage_body}
-    </main>
-    {footer}
-  </div>
-  <script src=\"{_escape(js_href)}\"></script>
-</body>
-</html>
-"""
-        output_path = SITE_DIR / current_path
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(doc, encoding="utf-8")
+    values = {
+        "site_name": site["site_name_html"],
+        "site_tagline": site["site_tagline_html"],
+        "hero_heading": _escape(hero_heading),
+        "hero_body": hero_body,
+        "hero_cta": hero_cta,
+        "hero_image_src": _escape(hero_image_src),
+        "newsletter": newsletter_html,
+        "overview": overview_html,
+        "sections": sections_html,
+        "page_body": page_body_html,
+    }
+    layout = _PAGE_LAYOUTS.get((slug, layout_variant), _render_hero_layout)
+    homepage_body = layout(values, site, links)
 
-    for post in posts:
-        _render_blog_post(post, pages)
+    doc = _render_document(page["title"], current_path, site, header, homepage_body, footer)
+    _write_page(current_path, doc)
 
-    for digest in digests:
-        _render_digest_page(digest, pages, site, links)
 
+def build_site() -> None:
+    _escape.cache_clear()
+    _render_block.cache_clear()
+    _read_site_config.cache_clear()
+    _read_links.cache_clear()
+    _OUTPUTS.clear()
+    _BUILD_CACHE.clear()
+    _HEADERS.clear()
+    _FOOTERS.clear()
+    _CREATED_DIRS.clear()
+    cache = _load_build_cache()
+    outputs = cache.get("outputs")
+    outputs = outputs if isinstance(outputs, dict) else {}
+    inputs = _input_fingerprint()
+    _BUILD_CACHE.update(outputs)
+    if outputs and cache.get("inputs") == inputs and all(
+        _recorded_output(SITE_DIR / name, _stat_record(SITE_DIR / name)) is not None for name in outputs
+    ):
+        return
+    pages = _read_control()
+    nav = _nav_titles(pages)
+    site = _read_site_config()
+    links = _read_links()
+    posts = _read_blog_posts()
+    digests = _read_digests()
+    layout_variant = (site.get("layout_variant") or "standard").strip().lower()
+    if layout_variant not in {"standard", "linkhub", "profile"}:
+        layout_variant = "standard"
+    show_digest_home = str(site.get("show_digest_home", "")).strip().lower() in {"1", "true", "yes", "on"}
+
+    static_writers = (_write_site_assets, _write_server_files)
+    ordered_pages = sorted(pages.items(), key=lambda item: item[1].get("order", 0))
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(writer) for writer in static_writers]
+        futures += [
+            executor.submit(
+                _render_page, slug, page, pages, nav, site, links, posts, digests, layout_variant, show_digest_home
+            )
+            for slug, page in ordered_pages
+        ]
+        futures += [executor.submit(_render_blog_post, post, pages, nav, site, links) for post in posts]
+        futures += [executor.submit(_render_digest_page, digest, pages, nav, site, links) for digest in digests]
+        for future in futures:
+            future.result()
 
-if __name__ == "__main__":
+    _prune_stale_outputs()
+    _save_build_cache(inputs)
+
+
+def watch_site() -> None:
     build_site()
+    print("[ALI] Build complete. Watching content/ and tools/assets/ for changes (Ctrl+C to stop).")
+    script_mtime = os.stat(__file__).st_mtime_ns
+    snapshot = _input_snapshot()
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            if os.stat(__file__).st_mtime_ns != script_mtime:
+                print("[ALI] tools/build.py changed, restarting.")
+                os.execv(sys.executable, [sys.executable, *sys.argv])
+            current = _input_snapshot()
+            if current == snapshot:
+                continue
+            snapshot = current
+            try:
+                build_site()
+            except SystemExit as exc:
+                print(f"[ALI] Build failed: {exc}")
+                continue
+            print("[ALI] Rebuilt site/.")
+    except KeyboardInterrupt:
+        print("[ALI] Stopped watching.")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the ALI site into site/.")
+    parser.add_argument("--watch", action="store_true", help="Rebuild whenever a file under content/ or tools/assets/ changes.")
+    args = parser.parse_args()
+
+    if args.watch:
+        watch_site()
+    else:
+        build_site()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())